@@ -1,8 +1,16 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 
 from childespython.transcript import Transcript
 
 
+def _raise(error: OSError):
+    """
+    Error handler for os.walk, so unreadable directories fail the load instead of being skipped silently.
+    """
+    raise error
+
+
 class ChildesDataset:
     """
     A class to represent a dataset of CHILDES transcripts.
@@ -29,22 +37,85 @@ class ChildesDataset:
         """
         Loads the dataset from the specified path.
         """
-        for dir in os.listdir(self.path):
-            self.dataset[dir] = dict()
-            corpus_path = os.path.join(self.path, dir)
-            if os.path.isdir(corpus_path):
-                for child in os.listdir(corpus_path):
-                    self.dataset[dir][child] = dict()
-                    child_path = os.path.join(corpus_path, child)
-                    if os.path.isdir(child_path):
-                        for recording in os.listdir(child_path):
-                            self.dataset[dir][child][recording] = dict()
-                            recording_path = os.path.join(child_path, recording)
-                            if recording.endswith(".cha"):
-                                transcript = Transcript(path=self.path, corpus=dir, child=child, recording=recording, name=recording)
-                                self.dataset[dir][child][recording] = transcript
+        for root, dirs, files in os.walk(self.path, onerror=_raise, followlinks=True):
+            relative_root = os.path.relpath(root, self.path)
+            parts = [] if relative_root == os.curdir else relative_root.split(os.sep)
+
+            if len(parts) == 0:
+                # <path>: every directory is a corpus
+                for corpus in dirs:
+                    self.dataset[corpus] = dict()
+            elif len(parts) == 1:
+                # <path>/<corpus>: every directory is a child
+                for child in dirs:
+                    self.dataset[parts[0]][child] = dict()
+            else:
+                # <path>/<corpus>/<child>: collect the recordings and do not descend any further
+                dirs[:] = []
+                corpus, child = parts
+                for recording in files:
+                    if recording.endswith(".cha"):
+                        transcript = Transcript(path=self.path, corpus=corpus, child=child,
+                                                recording=recording, name=recording)
+                        self.dataset[corpus][child][recording] = transcript
+
+    def get_transcripts(self) -> list:
+        """
+        Returns all transcripts of the dataset as a flat list, ordered by corpus, child and recording as loaded.
+
+        Returns:
+            list of Transcript: The transcripts of the dataset.
+        """
+        return [transcript
+                for children in self.dataset.values()
+                for recordings in children.values()
+                for transcript in recordings.values()]
+
+    def map_transcripts(self, fn, max_workers=None, chunksize: int = 16) -> list:
+        """
+        Applies a function to every transcript of the dataset in parallel worker processes.
+
+        Parameters:
+            fn (callable): A picklable (module-level) function taking a Transcript,
+                e.g. a function returning transcript.get_word_mlu("*CHI").
+            max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+            chunksize (int, optional): The number of transcripts sent to a worker at a time.
 
+        Returns:
+            list: The results of fn, in the order of get_transcripts().
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fn, self.get_transcripts(), chunksize=chunksize))
 
+    def to_dataframe(self):
+        """
+        Returns every utterance of the dataset as one row of a pandas DataFrame, for corpus-wide analyses with
+        vectorized string operations (e.g. df.utterance.str.split() for tokens, df.groupby(["corpus", "speaker"])
+        for per-speaker counts). Requires the optional pandas dependency (pip install childespython[pandas]).
 
+        Returns:
+            pandas.DataFrame: A DataFrame with the string columns "corpus", "child", "recording", "speaker" and
+            "utterance", Arrow-backed when pyarrow is installed.
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("to_dataframe requires pandas: pip install childespython[pandas]") from e
+        try:
+            import pyarrow  # noqa: F401
+            string_dtype = "string[pyarrow]"
+        except ImportError:
+            string_dtype = "string"
 
+        columns: dict = {"corpus": [], "child": [], "recording": [], "speaker": [], "utterance": []}
+        for transcript in self.get_transcripts():
+            for utterance in transcript.get_utterances():
+                if utterance.speaker is None:
+                    continue
+                columns["corpus"].append(transcript.corpus)
+                columns["child"].append(transcript.child)
+                columns["recording"].append(transcript.name)
+                columns["speaker"].append(utterance.speaker)
+                columns["utterance"].append(utterance.text)
 
+        return pd.DataFrame({name: pd.array(values, dtype=string_dtype) for name, values in columns.items()})
@@ -1,6 +1,40 @@
-import math
+import re
+import statistics
+from collections import Counter
+from typing import Optional
 
-from childespython.util import get_recording_by_recording_name, tokenize
+from childespython.util import (
+    DEFAULT_STRINGS_TO_BE_IGNORED,
+    get_recording_by_recording_name,
+    tokenize,
+)
+
+# Whitespace-separated words, skipping experimenter markings that start with "[:" or "[*"
+_WORD_RE = re.compile(r"(?<!\S)(?!\[[:*])\S+")
+
+
+class Utterance:
+    """
+    A single utterance of a CHILDES transcript: a speaker's tier and the dependent tiers that follow it.
+
+    Attributes:
+        id (int): The position of the utterance in the transcript, starting from 1.
+        speaker (str or None): The speaker tier marker (e.g., "*CHI"), or None if the utterance has no speaker's tier.
+        text (str or None): The text of the speaker's tier.
+        dependent_tiers (list of tuple): (marker, text) pairs of the dependent tiers (e.g., ("%mor", "...")),
+            in transcript order.
+    """
+    __slots__ = ("dependent_tiers", "id", "speaker", "text")
+
+    def __init__(self, id: int, speaker=None, text=None, dependent_tiers=None):
+        self.id: int = id
+        self.speaker = speaker
+        self.text = text
+        self.dependent_tiers: list = dependent_tiers if dependent_tiers is not None else []
+
+    def __repr__(self):
+        return f"Utterance(id={self.id!r}, speaker={self.speaker!r}, text={self.text!r}, " \
+               f"dependent_tiers={self.dependent_tiers!r})"
 
 
 class Transcript:
@@ -12,12 +46,14 @@ class Transcript:
         path (str): The base path where the corpus is located.
         corpus (str): The name of the CHILDES corpus (e.g., "Schaerlaekens").
         child (str): The identifier for the child participant (e.g., "Gijs").
-        recording (list of str): The lines of the transcript file.
+        recording_name (str): The filename of the transcript (e.g., "021023.cha").
+        recording (tuple of str): The lines of the transcript file, loaded lazily on first access.
     Methods:
         get_cleaned_transcript(): Returns a list of cleaned lines from the transcript file.
         get_participants_and_age(): Returns a dictionary with participant information and child's age.
         get_age_in_days(): Returns the child's age in days.
         get_participant_tiers_markers(): Returns a list of participant tiers markers.
+        get_utterances(): Returns the utterances of the transcript as Utterance records.
         get_structured_transcript(): Returns a structured representation of the transcript.
     """
     def __init__(self, path: str, corpus: str, child: str, recording: str, name: str):
@@ -34,7 +70,26 @@ class Transcript:
         self.corpus: str = corpus
         self.child: str = child
         self.name: str = name
-        self.recording: str = get_recording_by_recording_name(path=path, corpus_name=corpus, child_name=child, recording_name=recording)
+        self.recording_name: str = recording
+        self._recording: Optional[tuple] = None
+        self._cleaned_transcript: Optional[list] = None
+        self._participants_and_age: Optional[dict] = None
+        self._utterances: Optional[list] = None
+        self._structured_transcript: Optional[list] = None
+
+    @property
+    def recording(self) -> tuple:
+        """
+        The lines of the transcript file, read from disk on first access and cached afterwards.
+
+        Returns:
+            tuple of str: The lines of the transcript file.
+        """
+        if self._recording is None:
+            self._recording = get_recording_by_recording_name(path=self.path, corpus_name=self.corpus,
+                                                              child_name=self.child,
+                                                              recording_name=self.recording_name)
+        return self._recording
 
     def get_cleaned_transcript(self) -> list:
         """
@@ -43,24 +98,58 @@ class Transcript:
         Returns:
             list of str: A list of cleaned lines from the transcript file.
         """
+        if self._cleaned_transcript is not None:
+            return self._cleaned_transcript
+
         cleaned_up_transcript = []
+        current_parts: list = []  # The marker line and its continuation lines, joined once complete
         for line in self.recording:
             line = line.strip()
-            if line.startswith("@") or line.startswith("*") or line.startswith("%"):
-                cleaned_up_transcript.append(line)
+            if line[:1] in ("@", "*", "%"):
+                if current_parts:
+                    cleaned_up_transcript.append(" ".join(current_parts))
+                current_parts = [line]
             else:
-                if cleaned_up_transcript:
-                    cleaned_up_transcript[-1] += " " + line
-                else:
-                    cleaned_up_transcript.append(line)
+                current_parts.append(line)
+        if current_parts:
+            cleaned_up_transcript.append(" ".join(current_parts))
+        self._cleaned_transcript = cleaned_up_transcript
         return cleaned_up_transcript
 
+    def _iter_body_lines(self):
+        """
+        Yields the speaker tiers and dependent tiers of the transcript with their continuation lines joined,
+        like get_cleaned_transcript() but skipping the "@" headers and anything attached to them.
+
+        Yields:
+            str: A cleaned line starting with "*" or "%".
+        """
+        current_parts = None  # The current "*" or "%" line and its continuation lines, if inside one
+        for line in self.recording:
+            line = line.strip()
+            marker = line[:1]
+            if marker in ("*", "%"):
+                if current_parts:
+                    yield " ".join(current_parts)
+                current_parts = [line]
+            elif marker == "@":
+                if current_parts:
+                    yield " ".join(current_parts)
+                current_parts = None
+            elif current_parts is not None:
+                current_parts.append(line)
+        if current_parts:
+            yield " ".join(current_parts)
+
     def get_participants_and_age(self) -> dict:
         """
             Extracts participant information and the child's age from the transcript header.
             Returns:
                 dict: A dictionary with keys "participants" and "age" containing corresponding information.
             """
+        if self._participants_and_age is not None:
+            return self._participants_and_age
+
         cleaned_up_transcript = self.get_cleaned_transcript()
 
         participants_line = [line for line in cleaned_up_transcript if line.startswith("@Participants")]
@@ -69,7 +158,8 @@ class Transcript:
         age_line = [line for line in cleaned_up_transcript if line.startswith("@ID") and ";" in line]
         age = [bit for bit in age_line[0].split("|") if ";" in bit][0]
 
-        return {"participants": participants, "age": age}
+        self._participants_and_age = {"participants": participants, "age": age}
+        return self._participants_and_age
 
     def get_age_in_days(self) -> int:
         """
@@ -79,9 +169,9 @@ class Transcript:
             int: The child's age in days.
         """
         age_in_childes_format = self.get_participants_and_age()["age"]
-        return int(age_in_childes_format.split(";")[0]) * 12 * 30 + int(
-            age_in_childes_format.split(";")[1].split(".")[0]) * 30 + int(
-            age_in_childes_format.split(";")[1].split(".")[1])
+        years, rest = age_in_childes_format.split(";", 1)
+        months, days = rest.split(".", 1)
+        return int(years) * 12 * 30 + int(months) * 30 + int(days)
 
     def get_participant_tiers_markers(self) -> list:
         """
@@ -94,106 +184,129 @@ class Transcript:
         participant_tiers = ["*" + bit for bit in list_of_participants.split(" ") if len(bit) == 3]
         return participant_tiers
 
-    def get_structured_transcript(self) -> list:
+    def get_utterances(self) -> list:
         """
-        Processes each line of the transcript to extract the speaker tiers and the dependent tiers.
-        Each entry in the returned structured transcript contains a speaker's tier, dependent tiers,
-        and a unique utterance ID as an integer.
+        Processes each line of the transcript to extract the speaker tiers and the dependent tiers
+        into compact Utterance records.
 
         Returns:
-            list of dict: A list of dictionaries, each containing:
-                - "id": an integer starting from 1
-                - "speaker's tier": dict with the speaker tier
-                - "dependent tiers": dict with dependent tiers
+            list of Utterance: One record per utterance, numbered from 1, each with its speaker's tier
+            and its dependent tiers in transcript order.
         """
-        cleaned_up_transcript = self.get_cleaned_transcript()
-        structured_transcript = []
-        current_entry = {
-            "id": None,
-            "speaker's tier": {},
-            "dependent tiers": {}
-        }
+        if self._utterances is not None:
+            return self._utterances
 
-        body_of_transcript = [bit for bit in cleaned_up_transcript if bit.startswith(("*", "%"))]
-        id_counter = 1
+        utterances = []
+        current_utterance = Utterance(1)
 
-        for line in body_of_transcript:
+        # The same few markers ("*CHI:", "%mor:", ...) repeat on every line; strip each one only once
+        tier_markers: dict = {}
+
+        for line in self._iter_body_lines():
             line_parts = line.split('\t', 1)  # Split at the first tab only
+            tier_marker = tier_markers.get(line_parts[0])
+            if tier_marker is None:
+                # Markers start with "*" or "%", so only trailing colons need stripping
+                tier_marker = tier_markers[line_parts[0]] = line_parts[0].rstrip(":")
 
-            if "*" in line_parts[0]:
+            if line[0] == "*":
                 # Save current utterance before starting new one
-                if current_entry["speaker's tier"]:
-                    structured_transcript.append(current_entry)
-                    id_counter += 1
-                    current_entry = {
-                        "id": id_counter,
-                        "speaker's tier": {},
-                        "dependent tiers": {}
-                    }
-                current_entry["speaker's tier"] = {line_parts[0].strip(":"): line_parts[1]}
-
-            elif "%" in line_parts[0]:
-                current_entry["dependent tiers"].update(
-                    {line_parts[0].strip(":"): line_parts[1]}
-                )
+                if current_utterance.speaker is not None:
+                    utterances.append(current_utterance)
+                    current_utterance = Utterance(current_utterance.id + 1)
+                current_utterance.speaker = tier_marker
+                current_utterance.text = line_parts[1]
+
+            elif line[0] == "%":
+                current_utterance.dependent_tiers.append((tier_marker, line_parts[1]))
 
         # Append the final utterance
-        if current_entry["speaker's tier"] or current_entry["dependent tiers"]:
-            structured_transcript.append(current_entry)
+        if current_utterance.speaker is not None or current_utterance.dependent_tiers:
+            utterances.append(current_utterance)
 
-        return structured_transcript
+        self._utterances = utterances
+        return utterances
 
-    def get_word_mlu(self, speaker, list_of_strings_to_be_ignored=[",", ".", "?", "!", "(.)", "[?]"]):
+    def get_structured_transcript(self) -> list:
+        """
+        Returns the utterances of the transcript as dictionaries.
+        Each entry in the returned structured transcript contains a speaker's tier, dependent tiers,
+        and a unique utterance ID as an integer.
+
+        Returns:
+            list of dict: A list of dictionaries, each containing:
+                - "id": an integer starting from 1
+                - "speaker's tier": dict with the speaker tier
+                - "dependent tiers": dict with dependent tiers
+        """
+        if self._structured_transcript is not None:
+            return self._structured_transcript
+
+        self._structured_transcript = [
+            {
+                "id": utterance.id,
+                "speaker's tier": {utterance.speaker: utterance.text} if utterance.speaker is not None else {},
+                "dependent tiers": dict(utterance.dependent_tiers)
+            }
+            for utterance in self.get_utterances()
+        ]
+        return self._structured_transcript
+
+    def _iter_speaker_tier(self, speaker, tier="utterance"):
+        """
+        Yields the requested tier of every utterance by the given speaker.
+
+        Parameters:
+            speaker (str): The speaker tier marker (e.g., "*CHI").
+            tier (str): "utterance" for the speaker's tier itself, or a dependent tier marker (e.g., "%mor").
+
+        Yields:
+            str: The text of the requested tier, or an empty string if the utterance has no such dependent tier.
+        """
+        for utterance in self.get_utterances():
+            if utterance.speaker != speaker:
+                continue
+            if tier == "utterance":
+                yield utterance.text
+            else:
+                # The last occurrence wins, as in get_structured_transcript
+                text = ""
+                for tier_marker, tier_text in utterance.dependent_tiers:
+                    if tier_marker == tier:
+                        text = tier_text
+                yield text
+
+    def get_word_mlu(self, speaker, list_of_strings_to_be_ignored=None):
         """
        Returns a dictionary containing the word MLU and the standard deviation of the word MLU.
 
         Parameters:
             speaker (str): The speaker whose utterances and morphemes are being processed.
             list_of_strings_to_be_ignored (list, optional): List of strings to ignore in both word and morpheme counts.
+                Defaults to DEFAULT_STRINGS_TO_BE_IGNORED.
 
         Returns:
             dict: A dictionary containing the word MLU and the standard deviation of the word MLU.
         """
-        # Filter the structured transcript to get only the entries for the given speaker
-        structured_transcript = self.get_structured_transcript()
-        structured_transcript_filtered_by_speaker = [element for element in structured_transcript if
-                                                     speaker in element["speaker's tier"]]
-
-        total_words = 0
-        total_utterances = 0
-        word_mlus = []  # List to store MLU values for each utterance
-
-        for element in structured_transcript_filtered_by_speaker:
-            # Get the utterance from the speaker's tier
-            utterance = element["speaker's tier"][speaker]
-
-            # Clean up the utterance by removing unwanted strings
-            utterance = utterance.replace("[: ", "[:")  # Replaces [: x] with [;x]
-            list_of_words = utterance.split()  # Split by whitespace to get words
-
-            # Exclude words in the ignore list
-            list_of_words = [word for word in list_of_words if word not in list_of_strings_to_be_ignored]
-
-            # Exclude experimenter markings like [: or [*] without removing them
-            list_of_words = [word for word in list_of_words if not word.startswith(("[:", "[*"))]
-
-            # Count words
-            total_words += len(list_of_words)
-
-            # Increment utterance count
-            total_utterances += 1
-
-            # Store the MLU for this utterance
-            word_mlus.append(len(list_of_words))
+        if list_of_strings_to_be_ignored is None:
+            list_of_strings_to_be_ignored = DEFAULT_STRINGS_TO_BE_IGNORED
+        strings_to_be_ignored = frozenset(list_of_strings_to_be_ignored)  # O(1) membership per word
+
+        # Store the MLU for each utterance: the number of words, excluding words in the ignore list and
+        # experimenter markings like [: x] or [*] (after turning [: x] into [:x])
+        word_mlus = [
+            sum(1 for word in _WORD_RE.findall(utterance.replace("[: ", "[:")) if word not in strings_to_be_ignored)
+            for utterance in self._iter_speaker_tier(speaker)
+        ]
+        total_words = sum(word_mlus)
+        total_utterances = len(word_mlus)
 
         # Calculate word MLU (Mean Length of Utterance)
         word_mlu = round(total_words / total_utterances, 2) if total_utterances > 0 else 0
 
         # Calculate the standard deviation
         if len(word_mlus) > 1:
-            mean_mlu = sum(word_mlus) / len(word_mlus)
-            variance = sum((x - mean_mlu) ** 2 for x in word_mlus) / len(word_mlus)
-            std_dev = round(math.sqrt(variance), 2)
+            std_dev = round(statistics.pstdev(word_mlus), 2)
         else:
             std_dev = 0  # If there's only one utterance, no variability exists
 
@@ -213,45 +326,27 @@ class Transcript:
         :param match_type: The type of match to perform (e.g., "startswith", "contains", "endswith", "equals").
         :return: A dictionary with tokens as keys and their frequencies as values.
         """
-        structured_transcript = self.get_structured_transcript()
-        word_counts = {}
-
-        if pattern and match_type not in {"startswith", "contains", "endswith", "equals"}:
+        matchers = {
+            "startswith": lambda token: token.startswith(pattern),
+            "contains": lambda token: pattern in token,
+            "endswith": lambda token: token.endswith(pattern),
+            "equals": lambda token: token == pattern,
+        }
+        if pattern and match_type not in matchers:
             raise ValueError("match_type must be one of: 'startswith', 'contains', 'endswith', 'equals'")
 
-        filtered_segments = []
-        for el in structured_transcript:
-            if "speaker's tier" in el and speaker in el["speaker's tier"]:
-                filtered_segments.append(el)
+        # Pick the token filter once instead of re-checking match_type for every token
+        matches = matchers[match_type] if pattern else None
 
-        for el in filtered_segments:
-            if tier == "utterance":
-                text = el["speaker's tier"][speaker]
-            else:
-                if "dependent tiers" in el and tier in el["dependent tiers"]:
-                    text = el["dependent tiers"][tier]
-                else:
-                    text = ""
-
-            for token in tokenize(text):
-                if pattern:
-                    if match_type == "startswith" and not token.startswith(pattern):
-                        continue
-                    elif match_type == "contains" and pattern not in token:
-                        continue
-                    elif match_type == "endswith" and not token.endswith(pattern):
-                        continue
-                    elif match_type == "equals" and token != pattern:
-                        continue
-
-                if token in word_counts:
-                    word_counts[token] += 1
-                else:
-                    word_counts[token] = 1
-
-        return dict(sorted(word_counts.items(), key=lambda item: item[1], reverse=True))
-
-    def compute_ttr_from_frequencies(self, frequency_dictionary):
+        # Tokenize all texts of the tier in one scan; tokens never span the newlines joining them
+        tokens = tokenize("\n".join(self._iter_speaker_tier(speaker, tier)))
+        word_counts = Counter(filter(matches, tokens) if matches else tokens)
+
+        # most_common() sorts by frequency, keeping first-seen order among ties
+        return dict(word_counts.most_common())
+
+    @staticmethod
+    def compute_ttr_from_frequencies(frequency_dictionary):
         """
         Compute the Type-Token Ratio (TTR) from a frequency dictionary.
 
@@ -1,39 +1,82 @@
+import functools
 import os
+import re
 
-def tokenize(text, list_of_strings_to_be_ignored = [",", ".", "?", "!", "(.)", "[?]"]):
+DEFAULT_STRINGS_TO_BE_IGNORED = frozenset({",", ".", "?", "!", "(.)", "[?]"})
+
+_ALNUM_RE = re.compile(r"[^\W_]")  # Same characters as str.isalnum()
+
+
+def tokenize(text, list_of_strings_to_be_ignored=None):
     """
     Split text into tokens, stripping any trailing or leading ignore_list items.
+    Items are stripped repeatedly, trying them in list order, until no item matches either edge.
     Preserves original case of tokens and skips empty tokens.
 
     Parameters:
         text (str): input string to tokenize
-        list_of_strings_to_be_ignored (list of str): list of substrings to strip from tokens edges
+        list_of_strings_to_be_ignored (list of str, optional): list of substrings to strip from tokens edges.
+            Defaults to DEFAULT_STRINGS_TO_BE_IGNORED.
 
     Returns:
         cleaned token (str)
     """
 
+    if list_of_strings_to_be_ignored is None:
+        list_of_strings_to_be_ignored = DEFAULT_STRINGS_TO_BE_IGNORED
+    strings_to_be_ignored = tuple(list_of_strings_to_be_ignored)
+    if "" in strings_to_be_ignored:
+        return  # Stripping an empty string from the end empties every token
+    first_chars = {ign[0] for ign in strings_to_be_ignored}
+    last_chars = {ign[-1] for ign in strings_to_be_ignored}
+    # (item, length, first char, last char): comparing edge characters first skips most method calls
+    ignored_items = [(ign, len(ign), ign[0], ign[-1]) for ign in strings_to_be_ignored]
+
     for raw in text.split():
-        cleaned = raw
-        # Strip repeatedly from start and end if any ignore_list item matches
+        # Strip by moving start/end indices instead of slicing, so each token is processed in linear time
+        start, end = 0, len(raw)
+        startswith, endswith = raw.startswith, raw.endswith
         stripping = True
-        while stripping and cleaned:
+        while stripping and start < end:
+            if raw[start] not in first_chars and raw[end - 1] not in last_chars:
+                break  # No ignore_list item can match either edge
             stripping = False
-            for ign in list_of_strings_to_be_ignored:
-                if cleaned.startswith(ign):
-                    cleaned = cleaned[len(ign):]
+            for ign, length, first, last in ignored_items:
+                if start < end and raw[start] == first and startswith(ign, start, end):
+                    start += length
                     stripping = True
-                if cleaned.endswith(ign):
-                    cleaned = cleaned[:-len(ign)]
+                if start < end and raw[end - 1] == last and endswith(ign, start, end):
+                    end -= length
                     stripping = True
+        cleaned = raw[start:end]
 
         # Skip empty tokens or those without alphanumerics
-        if cleaned and any(c.isalnum() for c in cleaned):
+        if cleaned and _ALNUM_RE.search(cleaned):
             yield cleaned
 
+
+@functools.lru_cache(maxsize=512)
+def _read_lines(file_path: str, mtime_ns: int) -> tuple:
+    """
+    Reads and decodes a transcript file. Cached per (file_path, mtime_ns), so a modified file is read again.
+
+    Parameters:
+        file_path (str): The path to the transcript file.
+        mtime_ns (int): The modification time of the file, only used as part of the cache key.
+
+    Returns:
+        tuple of str: The lines of the file, without line endings.
+    """
+    with open(file_path, "rb") as my_file:
+        data = my_file.read()
+    # CHILDES transcripts are UTF-8; decode and split the whole file at once
+    return tuple(data.decode("utf-8", errors="replace").splitlines())
+
+
 def get_recording_by_recording_name(path, corpus_name: str, child_name: str, recording_name: str):
     """
     Retrieves the raw lines of a CHILDES transcript file given its corpus, child, and recording names.
+    Repeated reads of an unmodified file are served from a cache.
 
     Parameters:
         corpus_name (str): The name of the CHILDES corpus (e.g., "Schaerlaekens").
@@ -41,8 +84,8 @@ def get_recording_by_recording_name(path, corpus_name: str, child_name: str, rec
         recording_name (str): The filename of the transcript (e.g., "021023.cha").
 
     Returns:
-        list of str or None
-        If successful, returns a list of lines (strings) from the transcript file.
+        tuple of str or None
+        If successful, returns a tuple of lines (strings, without line endings) from the transcript file.
         Returns None if the file is not found or an error occurs while reading.
 
     """
@@ -51,8 +94,7 @@ def get_recording_by_recording_name(path, corpus_name: str, child_name: str, rec
 
     # Open the file and read its contents
     try:
-        with open(file_path, "r") as my_file:
-            return my_file.readlines()  # Returns a list of lines in the file
+        return _read_lines(file_path, os.stat(file_path).st_mtime_ns)
     except FileNotFoundError:
         print(f"Error: {file_path} not found.")
         return None
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+from childespython.dataset import ChildesDataset
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def word_mlu_of_child(transcript):
+    return transcript.child, transcript.get_word_mlu("*CHI")
+
+
+def test_load_dataset():
+    dataset = ChildesDataset(FIXTURES)
+    assert sorted(dataset.dataset["Schaerlaekens"]) == ["Gijs", "Kim"]
+    assert sorted(transcript.name for transcript in dataset.get_transcripts()) == [
+        "021023.cha",
+        "030101.cha",
+    ]
+
+
+def test_map_transcripts_matches_sequential_map():
+    dataset = ChildesDataset(FIXTURES)
+    expected = [word_mlu_of_child(transcript) for transcript in dataset.get_transcripts()]
+    assert dataset.map_transcripts(word_mlu_of_child, max_workers=2) == expected
+    assert dict(expected)["Gijs"] == {"word mlu": 4.0, "word mlu standard deviation": 1.0}
+
+
+def test_to_dataframe():
+    pytest.importorskip("pandas")
+    dataframe = ChildesDataset(FIXTURES).to_dataframe()
+    assert list(dataframe.columns) == ["corpus", "child", "recording", "speaker", "utterance"]
+
+    gijs = dataframe[dataframe.child == "Gijs"]
+    assert gijs.values.tolist() == [
+        ["Schaerlaekens", "Gijs", "021023.cha", "*CHI", "ik wil (.) die auto [: auto] hebben ."],
+        ["Schaerlaekens", "Gijs", "021023.cha", "*MOT", "wat wil jij dan ?"],
+        ["Schaerlaekens", "Gijs", "021023.cha", "*CHI", "nee nee nee ."],
+    ]
+    assert len(dataframe[dataframe.child == "Kim"]) == 3
@@ -0,0 +1,63 @@
+import os
+import shutil
+import time
+
+from childespython.util import get_recording_by_recording_name, tokenize
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def test_tokenize_default_ignore_list():
+    text = 'ik wil (.) die auto [: auto] hebben . ""auto!! [?] [*] , a,b (.)x.(.)'
+    assert list(tokenize(text)) == [
+        "ik",
+        "wil",
+        "die",
+        "auto",
+        "auto]",
+        "hebben",
+        '""auto',
+        "a,b",
+        "x",
+    ]
+
+
+def test_tokenize_custom_ignore_list_strips_in_list_order():
+    assert list(tokenize("?(.)][é", ["?", ").", "?("])) == ["(.)][é"]
+    assert list(tokenize("b.0?0é.[", ["b", "b.", "(bb"])) == [".0?0é.["]
+    assert list(tokenize("uh, euh", [",", "uh"])) == ["e"]
+    assert list(tokenize("(.)hoi", [])) == ["(.)hoi"]
+
+
+def test_tokenize_long_punctuation_runs_in_linear_time():
+    # Quadratic edge stripping took 10+ seconds on tokens like these
+    start = time.perf_counter()
+    assert list(tokenize("x" + ",?" * 10000 + "b")) == ["x" + ",?" * 10000 + "b"]
+    assert list(tokenize(("a" + "." * 3000) * 5)) == [("a" + "." * 3000) * 4 + "a"]
+    assert list(tokenize("(.)" * 10000 + "x" + ",?!" * 10000)) == ["x"]
+    assert time.perf_counter() - start < 1
+
+
+def test_recording_cache_returns_fresh_lines_after_file_changes(tmp_path):
+    shutil.copytree(os.path.join(FIXTURES, "Schaerlaekens"), tmp_path / "Schaerlaekens")
+    file_path = tmp_path / "Schaerlaekens" / "Gijs" / "021023.cha"
+
+    def read():
+        return get_recording_by_recording_name(str(tmp_path), "Schaerlaekens", "Gijs", "021023.cha")
+
+    lines = read()
+    assert lines[0] == "@UTF8"
+    assert read() is lines
+
+    stat = os.stat(file_path)
+    file_path.write_text("@Begin\r\n@End\r\n", encoding="utf-8")
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert read() == ("@Begin", "@End")
+
+
+def test_missing_recording_returns_none(tmp_path):
+    assert (
+        get_recording_by_recording_name(str(tmp_path), "Schaerlaekens", "Gijs", "missing.cha")
+        is None
+    )